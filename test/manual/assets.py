@@ -0,0 +1,223 @@
+from json import dumps, loads
+from mmap import mmap, ACCESS_READ
+from pathlib import Path
+from struct import Struct, error as StructError
+from sys import path
+from tkinter import Tk, PhotoImage
+
+
+ROOT_DIR = Path(path[0]).parent.parent
+DATA_DIR = ROOT_DIR / 'data'
+IMAGES_DIR = DATA_DIR / 'images'
+
+# изображения видов питомцев отображаются в главном меню, остальные — на кнопках действий в игре
+KIND_IMAGES = ('dog.png', 'cat.png', 'mouse.png')
+
+MENU_COLUMNS = 2
+GAME_BUTTONS = 6
+
+# распространённые разрешения экранов, для которых размеры изображений вычисляются заранее
+STANDARD_SCREENS = (
+    (1280, 720),
+    (1280, 1024),
+    (1366, 768),
+    (1440, 900),
+    (1536, 864),
+    (1600, 900),
+    (1680, 1050),
+    (1920, 1080),
+    (1920, 1200),
+    (2560, 1080),
+    (2560, 1440),
+    (3440, 1440),
+    (3840, 2160),
+)
+
+
+def window_size(screen_width: int, screen_height: int) -> tuple[int, int]:
+    return screen_width // 3, screen_height * 3 // 4
+
+
+# размеры элементов интерфейса вычисляются только здесь: по ним же заранее отрисовываются изображения пакета
+def menu_padding(width: int) -> int:
+    return width // 100 + 1
+
+
+def menu_image_size(width: int) -> int:
+    pad = menu_padding(width)
+    return (width - pad*2*(MENU_COLUMNS+1)) // MENU_COLUMNS - 10
+
+
+def game_padding(width: int) -> int:
+    return (width // 100 + 1) * 2
+
+
+def game_screen_size(width: int) -> int:
+    return width - game_padding(width) * 2
+
+
+def actions_height(width: int, height: int) -> int:
+    return (height - game_screen_size(width) - game_padding(width)*4) // 3
+
+
+def action_image_size(width: int, height: int) -> int:
+    return actions_height(width, height) - 10
+
+
+def standard_sizes(name: str) -> set[int]:
+    sizes = set()
+    for screen in STANDARD_SCREENS:
+        width, height = window_size(*screen)
+        if name in KIND_IMAGES:
+            sizes.add(menu_image_size(width))
+        else:
+            sizes.add(action_image_size(width, height))
+    return {size for size in sizes if size > 0}
+
+
+class AssetPack:
+    """Файл с изображениями, заранее отрисованными в стандартных размерах.
+
+    Файл состоит из заголовка, JSON-индекса и следующих за ним изображений в формате PPM (P6), который Tk читает без распаковки. Индекс сопоставляет путь изображения относительно каталога data и размер со смещением и длиной данных, а также хранит размер и время изменения исходного PNG: изображения, исходный файл которых изменился после сборки пакета, считаются отсутствующими.
+    """
+    default_path: Path = IMAGES_DIR / 'assets.pack'
+    magic: bytes = b'TMGPACK1'
+    header = Struct('<8sI')
+
+    def __init__(self, file: Path):
+        with open(file, 'rb') as fileobj:
+            self._data = mmap(fileobj.fileno(), 0, access=ACCESS_READ)
+        try:
+            magic, index_length = self.header.unpack_from(self._data)
+            if magic != self.magic:
+                raise ValueError(f'{file} не является пакетом изображений')
+            start = self.header.size
+            if start + index_length > len(self._data):
+                raise ValueError(f'{file}: индекс выходит за пределы файла')
+            self._index: dict[str, dict] = loads(self._data[start:start+index_length])
+            self._offset = start + index_length
+        # ошибка разбора JSON — подкласс ValueError
+        except (StructError, ValueError):
+            self._data.close()
+            raise
+
+    @classmethod
+    def open(cls, file: Path = None) -> 'AssetPack | None':
+        try:
+            return cls(file or cls.default_path)
+        except (OSError, ValueError, StructError):
+            return None
+
+    @staticmethod
+    def _source(img_path: str | Path) -> list[int] | None:
+        try:
+            stat = Path(img_path).stat()
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    @staticmethod
+    def _key(img_path: str | Path) -> str | None:
+        try:
+            return Path(img_path).relative_to(DATA_DIR).as_posix()
+        except ValueError:
+            return None
+
+    def image(
+            self,
+            img_path: str | Path,
+            size: int = None,
+    ) -> PhotoImage | None:
+        """Возвращает изображение из пакета или None, если изображение такого размера в пакете отсутствует. Без указания размера возвращается изображение в исходном размере."""
+        entry = self._index.get(self._key(img_path))
+        if entry is None or entry.get('source') != self._source(img_path):
+            return None
+        if size is None:
+            width, height = entry['native']
+        else:
+            width = height = size
+        location = entry['images'].get(f'{width}x{height}')
+        if location is None:
+            return None
+        offset, length = location
+        start = self._offset + offset
+        if offset < 0 or length <= 0 or start + length > len(self._data):
+            return None
+        return PhotoImage(data=self._data[start:start+length], format='ppm')
+
+    @classmethod
+    def build(
+            cls,
+            sources: dict[str, Path],
+            sizes: dict[str, set[int]],
+            file: Path = None,
+    ) -> None:
+        index = {}
+        blobs = []
+        offset = 0
+        for key, source in sources.items():
+            image = PhotoImage(file=source)
+            width, height = image.width(), image.height()
+            pixels = _get_pixels(image, width, height)
+            entry = index[key] = {
+                'source': cls._source(source),
+                'native': [width, height],
+                'images': {},
+            }
+            for new_width, new_height in {(width, height)} | {(s, s) for s in sizes[key]}:
+                blob = _render_ppm(pixels, width, height, new_width, new_height)
+                entry['images'][f'{new_width}x{new_height}'] = [offset, len(blob)]
+                blobs.append(blob)
+                offset += len(blob)
+
+        raw_index = dumps(index).encode('utf-8')
+        file = file or cls.default_path
+        tmp = file.with_suffix('.tmp')
+        with open(tmp, 'wb') as fileobj:
+            fileobj.write(cls.header.pack(cls.magic, len(raw_index)))
+            fileobj.write(raw_index)
+            for blob in blobs:
+                fileobj.write(blob)
+        tmp.replace(file)
+
+
+def _get_pixels(
+        image: PhotoImage,
+        width: int,
+        height: int
+) -> list[bytes]:
+    return [
+        b''.join(bytes(image.get(x, y)) for x in range(width))
+        for y in range(height)
+    ]
+
+
+def _render_ppm(
+        pixels: list[bytes],
+        old_width: int,
+        old_height: int,
+        new_width: int,
+        new_height: int
+) -> bytes:
+    # тот же алгоритм ближайшего соседа, что и в view._resize_image
+    columns = [x * old_width // new_width * 3 for x in range(new_width)]
+    rows = []
+    for y in range(new_height):
+        row = pixels[y * old_height // new_height]
+        rows.append(b''.join(row[x:x+3] for x in columns))
+    header = f'P6\n{new_width} {new_height}\n255\n'.encode('ascii')
+    return header + b''.join(rows)
+
+
+if __name__ == '__main__':
+    # сборка пакета: python assets.py
+    root = Tk()
+    root.withdraw()
+    sources, sizes = {}, {}
+    for file in sorted(IMAGES_DIR.glob('*.png')):
+        key = AssetPack._key(file)
+        sources[key] = file
+        sizes[key] = standard_sizes(file.name)
+    AssetPack.build(sources, sizes)
+    root.destroy()
+    print(f'{AssetPack.default_path}: {len(sources)} изображений')
@@ -1,5 +1,10 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from json import dumps, loads
+from math import inf
 from pathlib import Path
-from sys import path
+from sys import path, getsizeof
+from time import time
 
 from model import *
 
@@ -7,6 +12,13 @@ from model import *
 ROOT_DIR = Path(path[0]).parent.parent
 DATA_DIR = ROOT_DIR / 'data'
 
+# количество пересчётов параметров за 1 ИД: во время работы приложения 1 ИД соответствует 10 мин реального времени
+DAY_TICKS = 600
+# масштабирование времени при пересчёте параметров после загрузки питомца: 1 ИД к 1 ч реального времени
+OFFLINE_DAY = 3600
+# бюджет памяти для питомцев, находящихся в памяти, в байтах
+MEMORY_BUDGET = 64 * 2**20
+
 
 class KindLoader:
     default_path: Path = DATA_DIR / 'kinds'
@@ -27,9 +39,16 @@ class KindLoader:
 
 
 class Application:
-    def __init__(self):
+    def __init__(self, manager: 'CreatureManager' = None):
         self.view = None
+        # пустой менеджер ложен из-за __len__, поэтому проверка выполняется на None
+        if manager is None:
+            manager = CreatureManager(KindLoader.load(), MEMORY_BUDGET)
+        self.manager = manager
         self.creature: Creature = None
+        self.creature_id: int = None
+        # количество пересчётов, прошедших с начала текущего ИД
+        self.day_tick: int = 0
     
     def link_view(self, view):
         self.view = view
@@ -37,21 +56,29 @@ class Application:
     def run(self) -> None:
         if self.is_live_creature():
             self.creature = self.load_creature()
+            self.view.game_frame()
         else:
             self.view.menu_frame(KindLoader.load())
         self.view.mainloop()
         self.save_creature()
     
     def is_live_creature(self) -> bool:
-        ...
-        # для теста
-        return False
+        return self.manager.last_id is not None
     
     def load_creature(self) -> Creature:
-        ...
+        self.creature_id = self.manager.last_id
+        return self._progress_creature()
     
     def _progress_creature(self) -> Creature:
-        ...
+        # пересчёт параметров за время, прошедшее с последнего сохранения, выполняется менеджером с помощью progress()
+        self.creature = self.manager.get(self.creature_id)
+        self.day_tick = self.manager.resident[self.creature_id].tick
+        return self.creature
+    
+    def update_creature(self, ticks: int) -> None:
+        """Выполняет пересчёты параметров питомца во время работы приложения."""
+        self.creature = self.manager.update(self.creature_id, ticks)
+        self.day_tick = self.manager.resident[self.creature_id].tick
     
     def new_creature(
             self, 
@@ -59,10 +86,229 @@ class Application:
             name: str
     ) -> Creature:
         self.creature = Creature(kind, name)
+        self.creature_id = self.manager.add(self.creature)
+        self.day_tick = 0
         return self.creature
     
     def save_creature(self):
-        ...
+        if self.creature_id is not None:
+            self.manager.save(self.creature_id, self.day_tick)
+
+
+def progress(
+        creature: Creature,
+        ticks: int,
+        tick: int = 0,
+) -> int:
+    """Выполняет пересчёты параметров питомца за прошедшее время, увеличивая возраст в конце каждого ИД. Возвращает количество пересчётов, прошедших с начала текущего ИД."""
+    while ticks > 0:
+        steps = min(ticks, DAY_TICKS - tick)
+        done = 0
+        while done < steps:
+            event = creature.ticks_to_event()
+            # параметры больше не изменятся до конца ИД — оставшиеся пересчёты пропускаются
+            if event == inf:
+                break
+            for _ in range(min(event, steps - done)):
+                creature.update()
+            done += event
+        ticks -= steps
+        tick += steps
+        if tick == DAY_TICKS:
+            tick = 0
+            if creature.age < creature.kind.max_age:
+                creature.age += 1
+            elif event == inf:
+                # возраст максимальный и параметры не изменяются — остальные ИД проходят без изменений
+                tick = ticks % DAY_TICKS
+                break
+    return tick
+
+
+def _footprint(creature: Creature) -> int:
+    # приблизительный объём памяти, занимаемый питомцем без учёта общих для всех питомцев объектов вида
+    # все состояния в истории однотипны, поэтому объём истории оценивается по последнему состоянию без её обхода
+    objects = [
+        creature,
+        *creature.params.values(),
+        *creature.player_actions,
+        *creature.creature_actions,
+    ]
+    size = (
+        sum(getsizeof(obj) + getsizeof(obj.__dict__) for obj in objects)
+        + getsizeof(creature.params)
+        + getsizeof(creature.history)
+    )
+    if creature.history:
+        state = creature.history[-1]
+        state_size = (
+            getsizeof(state)
+            + getsizeof(state.__dict__)
+            + sum(getsizeof(value) for value in state.__dict__.values())
+        )
+        size += state_size * len(creature.history)
+    return size
+
+
+@dataclass
+class Hibernated:
+    """Питомец, выгруженный на диск."""
+    age: int
+    saved: float
+
+
+@dataclass
+class Resident:
+    """Питомец, находящийся в памяти."""
+    creature: Creature
+    # момент реального времени, которому соответствует состояние питомца
+    saved: float
+    # количество пересчётов, прошедших с начала текущего ИД
+    tick: int
+    size: int
+
+
+class CreatureManager:
+    """Хранилище питомцев с ограничением занимаемой памяти.
+    
+    При превышении бюджета давно не использовавшиеся питомцы выгружаются на диск, в памяти остаются только их возраст и время сохранения. При обращении питомец загружается, а его параметры пересчитываются за прошедшее время.
+    
+    Каждый питомец хранится в отдельном файле: первая строка содержит сведения о питомце, вторая — историю его состояний. При создании менеджера список выгруженных питомцев восстанавливается по первым строкам файлов.
+    """
+    default_path: Path = DATA_DIR / 'hibernated'
+    
+    def __init__(
+            self,
+            kinds: list[Kind],
+            budget: int,
+            hibernate_path: Path = None,
+    ):
+        self.kinds = {kind.name: kind for kind in kinds}
+        self.budget = budget
+        self.path = hibernate_path or self.default_path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.resident: OrderedDict[int, Resident] = OrderedDict()
+        self.hibernated: dict[int, Hibernated] = {}
+        self.size = 0
+        for file in self.path.glob('*.json'):
+            with open(file, encoding='utf-8') as fileobj:
+                header = loads(fileobj.readline())
+            self.hibernated[int(file.stem)] = Hibernated(header['age'], header['saved'])
+        self._last_id = max(self.hibernated, default=0)
+    
+    @property
+    def last_id(self) -> int | None:
+        ids = self.resident.keys() | self.hibernated.keys()
+        return max(ids, default=None)
+    
+    def __len__(self):
+        return len(self.resident) + len(self.hibernated)
+    
+    def __contains__(self, creature_id: int):
+        return creature_id in self.resident or creature_id in self.hibernated
+    
+    def add(self, creature: Creature) -> int:
+        self._last_id += 1
+        resident = Resident(creature, time(), 0, 0)
+        self._write(self._last_id, resident)
+        self._store(self._last_id, resident)
+        return self._last_id
+    
+    def update(self, creature_id: int, ticks: int) -> Creature:
+        """Выполняет пересчёты параметров питомца во время работы приложения: состояние питомца становится соответствующим текущему моменту, а занимаемая им память учитывается в бюджете."""
+        if creature_id in self.hibernated:
+            self.get(creature_id)
+        resident = self.resident.pop(creature_id)
+        self.size -= resident.size
+        resident.tick = progress(resident.creature, ticks, resident.tick)
+        resident.saved = time()
+        self._store(creature_id, resident)
+        return resident.creature
+    
+    def save(self, creature_id: int, tick: int) -> None:
+        """Сохраняет на диск питомца, состояние которого соответствует текущему моменту."""
+        resident = self.resident.pop(creature_id)
+        self.size -= resident.size
+        resident.saved = time()
+        resident.tick = tick
+        self._write(creature_id, resident)
+        self._store(creature_id, resident)
+    
+    def get(self, creature_id: int) -> Creature:
+        if creature_id in self.hibernated:
+            resident = self._revive(creature_id)
+        else:
+            resident = self.resident.pop(creature_id)
+            self.size -= resident.size
+        self._catch_up(resident)
+        self._store(creature_id, resident)
+        return resident.creature
+    
+    def _store(self, creature_id: int, resident: Resident) -> None:
+        resident.size = _footprint(resident.creature)
+        self.resident[creature_id] = resident
+        self.size += resident.size
+        # последний использованный питомец остаётся в памяти, даже если один превышает бюджет
+        while self.size > self.budget and len(self.resident) > 1:
+            self._hibernate(next(iter(self.resident)))
+    
+    @staticmethod
+    def _catch_up(resident: Resident) -> None:
+        tick_seconds = OFFLINE_DAY / DAY_TICKS
+        ticks = int((time() - resident.saved) // tick_seconds)
+        resident.tick = progress(resident.creature, ticks, resident.tick)
+        # остаток времени меньше одного пересчёта будет учтён при следующем обращении
+        resident.saved += ticks * tick_seconds
+    
+    def _file(self, creature_id: int) -> Path:
+        return self.path / f'{creature_id}.json'
+    
+    def _write(self, creature_id: int, resident: Resident) -> None:
+        creature = resident.creature
+        header = {
+            'kind': creature.kind.name,
+            'name': creature.name,
+            'age': creature.age,
+            'tick': resident.tick,
+            'saved': resident.saved,
+            'params': {cls.__name__: param.value for cls, param in creature.params.items()},
+        }
+        history = {
+            name: [getattr(state, name) for state in creature.history]
+            for name in ('age', *(cls.__name__ for cls in creature.params))
+        }
+        # запись во временный файл с последующей заменой: при сбое остаётся предыдущая версия файла
+        file = self._file(creature_id)
+        tmp = file.with_suffix('.tmp')
+        tmp.write_text(
+            dumps(header, ensure_ascii=False) + '\n' + dumps(history),
+            encoding='utf-8'
+        )
+        tmp.replace(file)
+    
+    def _hibernate(self, creature_id: int) -> None:
+        resident = self.resident.pop(creature_id)
+        self.size -= resident.size
+        self._write(creature_id, resident)
+        self.hibernated[creature_id] = Hibernated(resident.creature.age, resident.saved)
+    
+    def _revive(self, creature_id: int) -> Resident:
+        # файл не удаляется: до следующей записи он остаётся последней сохранённой версией питомца
+        stub = self.hibernated.pop(creature_id)
+        with open(self._file(creature_id), encoding='utf-8') as fileobj:
+            data = loads(fileobj.readline())
+            history = loads(fileobj.readline())
+        
+        creature = Creature(self.kinds[data['kind']], data['name'])
+        creature.age = stub.age
+        for cls, param in creature.params.items():
+            param.value = data['params'][cls.__name__]
+        for i, age in enumerate(history.pop('age')):
+            state = State(age)
+            for name, values in history.items():
+                setattr(state, name, values[i])
+            creature.history.append(state)
+        return Resident(creature, stub.saved, data['tick'], 0)
 
 
 kinds = KindLoader.load()
@@ -0,0 +1,191 @@
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from random import Random
+from statistics import quantiles
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from time import perf_counter_ns
+import tracemalloc
+
+import model
+import controller
+
+
+@dataclass
+class Scenario:
+    """Сценарий поведения синтетического игрока."""
+    # количество питомцев каждого вида
+    creatures: int = 10
+    # продолжительность жизни каждого питомца в пересчётах параметров
+    ticks: int = 10_000
+    # наибольшее количество пересчётов, передаваемых контроллеру за один вызов
+    batch: int = 100
+    # вероятность кормления питомца в каждом пересчёте активного периода
+    feed_rate: float = 0.05
+    # продолжительность активного периода и периода бездействия игрока в пересчётах
+    active_ticks: int = 200
+    idle_ticks: int = 800
+    seed: int = 0
+    trace_memory: bool = True
+
+
+@dataclass
+class Report:
+    ticks: int
+    actions: int
+    seconds: float
+    update_latencies: list[int]
+    action_latencies: list[int]
+    resident: int = 0
+    hibernated: int = 0
+    resident_size: int = 0
+    memory_growth: int = 0
+    memory_peak: int = 0
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.seconds if self.seconds else 0
+
+    @staticmethod
+    def _percentiles(latencies: list[int]) -> str:
+        if len(latencies) < 2:
+            return '—'
+        cuts = quantiles(latencies, n=100, method='inclusive')
+        return ', '.join(
+            f'p{p}={cuts[p-1]/1000:.1f}'
+            for p in (50, 90, 99)
+        ) + f', max={max(latencies)/1000:.1f} мкс'
+
+    def __str__(self):
+        lines = [
+            f'пересчётов: {self.ticks} за {self.seconds:.2f} с ({self.ticks_per_second:.0f}/с)',
+            f'задержка update_creature: {self._percentiles(self.update_latencies)}',
+            f'действий игрока: {self.actions}',
+            f'задержка действия: {self._percentiles(self.action_latencies)}',
+            f'питомцев в памяти: {self.resident} ({self.resident_size/1024:.1f} КиБ), на диске: {self.hibernated}',
+        ]
+        if self.memory_peak:
+            lines += [
+                f'прирост памяти: {self.memory_growth/1024:.1f} КиБ',
+                f'пик памяти: {self.memory_peak/1024:.1f} КиБ',
+            ]
+        return '\n'.join(lines)
+
+
+class ScriptedView:
+    """Представление без графического интерфейса: вместо игрока действует сценарий."""
+    def __init__(
+            self,
+            app: controller.Application,
+            scenario: Scenario,
+    ):
+        self.app = app
+        self.scenario = scenario
+        self.kinds: list[model.Kind] = []
+        self.report: Report = None
+        self._random: Random = None
+        self._record = True
+
+    def menu_frame(self, kinds: list[model.Kind]) -> None:
+        self.kinds = kinds
+
+    def game_frame(self) -> None:
+        pass
+
+    def mainloop(self) -> None:
+        # tracemalloc замедляет пересчёты в несколько раз, поэтому скорость и задержки измеряются в отдельном проходе без него
+        self.report = Report(0, 0, 0, [], [])
+        start = perf_counter_ns()
+        self.run_scenario(record=True)
+        self.report.seconds = (perf_counter_ns() - start) / 1e9
+        manager = self.app.manager
+        self.report.resident = len(manager.resident)
+        self.report.hibernated = len(manager.hibernated)
+        self.report.resident_size = manager.size
+        if self.scenario.trace_memory:
+            # в проходе с замером памяти задержки не сохраняются, поэтому память занимают только питомцы и контроллер
+            tracemalloc.start()
+            start_memory, _ = tracemalloc.get_traced_memory()
+            self.run_scenario(record=False)
+            end_memory, self.report.memory_peak = tracemalloc.get_traced_memory()
+            self.report.memory_growth = end_memory - start_memory
+            tracemalloc.stop()
+
+    def run_scenario(self, record: bool) -> None:
+        self._random = Random(self.scenario.seed)
+        self._record = record
+        for kind in self.kinds:
+            for n in range(self.scenario.creatures):
+                self.app.new_creature(kind, f'{kind.name} {n}')
+                self.play()
+
+    def play(self) -> None:
+        # игровое время идёт через тот же путь, что и в Game: Application.update_creature → CreatureManager → progress()
+        # пересчёты между действиями игрока передаются контроллеру пакетами
+        scenario = self.scenario
+        period = scenario.active_ticks + scenario.idle_ticks
+        pending = 0
+        for tick in range(1, scenario.ticks + 1):
+            if tick % period < scenario.active_ticks and self._random.random() < scenario.feed_rate:
+                self.advance(pending)
+                pending = 0
+                self.feed()
+            pending += 1
+            if pending == scenario.batch:
+                self.advance(pending)
+                pending = 0
+        self.advance(pending)
+
+    def advance(self, ticks: int) -> None:
+        if not ticks:
+            return
+        start = perf_counter_ns()
+        self.app.update_creature(ticks)
+        if self._record:
+            self.report.update_latencies.append(perf_counter_ns() - start)
+            self.report.ticks += ticks
+
+    def feed(self) -> None:
+        actions = [
+            action
+            for action in self.app.creature.player_actions
+            if isinstance(action, model.Feed)
+        ]
+        if not actions:
+            return
+        start = perf_counter_ns()
+        actions[0].do()
+        if self._record:
+            self.report.action_latencies.append(perf_counter_ns() - start)
+            self.report.actions += 1
+
+
+def run(scenario: Scenario) -> Report:
+    # синтетические питомцы сохраняются во временный каталог, а не к питомцам игрока
+    with TemporaryDirectory() as hibernate_path:
+        manager = controller.CreatureManager(
+            controller.KindLoader.load(),
+            controller.MEMORY_BUDGET,
+            Path(hibernate_path),
+        )
+        app = controller.Application(manager)
+        view = ScriptedView(app, scenario)
+        app.link_view(view)
+        app.run()
+    return view.report
+
+
+if __name__ == '__main__':
+    defaults = Scenario()
+    parser = ArgumentParser(description='Нагрузочное тестирование контроллера синтетическими игроками')
+    parser.add_argument('-c', '--creatures', type=int, default=defaults.creatures)
+    parser.add_argument('-t', '--ticks', type=int, default=defaults.ticks)
+    parser.add_argument('-b', '--batch', type=int, default=defaults.batch)
+    parser.add_argument('--feed-rate', type=float, default=defaults.feed_rate)
+    parser.add_argument('--active-ticks', type=int, default=defaults.active_ticks)
+    parser.add_argument('--idle-ticks', type=int, default=defaults.idle_ticks)
+    parser.add_argument('--seed', type=int, default=defaults.seed)
+    parser.add_argument('--no-memory', dest='trace_memory', action='store_false')
+    args = parser.parse_args()
+
+    print(run(Scenario(**vars(args))))
@@ -3,12 +3,17 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
 from functools import cached_property
+from math import ceil, floor, inf
 from pathlib import Path
 from random import choice, sample
 from sys import path
 from typing import Type
 
 
+# точность, с которой округляется прогнозируемое количество пересчётов: шаги параметров не представимы точно в двоичной арифметике (0.1 и т.п.)
+TICKS_PRECISION = 9
+
+
 ROOT_DIR = Path(path[0]).parent.parent
 DATA_DIR = ROOT_DIR / 'data'
 
@@ -87,6 +92,25 @@ class CreatureParameter(ABC):
         else:
             self.__value = new_value
     
+    @property
+    def rate(self) -> float:
+        """Изменение значения параметра за один пересчёт при текущем состоянии питомца."""
+        return 0
+    
+    def ticks_to_limit(self) -> float:
+        """Количество пересчётов до достижения параметром минимума или максимума."""
+        rate = self.rate
+        # параметр ещё не на границе, поэтому до неё остаётся хотя бы один пересчёт, даже если после округления расстояние нулевое
+        if rate < 0 and self.value > self._min:
+            return max(ceil(round((self.value - self._min) / -rate, TICKS_PRECISION)), 1)
+        elif rate > 0 and self.value < self._max:
+            return max(ceil(round((self._max - self.value) / rate, TICKS_PRECISION)), 1)
+        return inf
+    
+    def ticks_to_event(self) -> float:
+        """Количество пересчётов до ближайшего события, после которого изменится поведение параметров."""
+        return self.ticks_to_limit()
+    
     @abstractmethod
     def update(self) -> None:
         pass
@@ -95,22 +119,43 @@ class CreatureParameter(ABC):
 class Health(CreatureParameter):
     name = 'здоровье'
     
-    def update(self) -> None:
+    @property
+    def rate(self) -> float:
         satiety = self.creature.params[Satiety]
-        critical = sum(satiety.range) / 4
-        if 0 < satiety.value < critical:
-            self.value -= 0.5
+        if 0 < satiety.value < satiety.critical:
+            return -0.5
         elif satiety.value == 0:
-            self.value -= 1
+            return -1
         else:
-            self.value += 0.1
+            return 0.1
+    
+    def update(self) -> None:
+        self.value += self.rate
 
 
 class Satiety(CreatureParameter):
     name = 'сытость'
     
+    @property
+    def critical(self) -> float:
+        """Порог сытости, ниже которого начинает снижаться здоровье."""
+        return sum(self.range) / 4
+    
+    @property
+    def rate(self) -> float:
+        return -1
+    
+    def ticks_to_critical(self) -> float:
+        """Количество пересчётов до перехода сытости через критический порог."""
+        if self.value < self.critical:
+            return inf
+        return floor(round((self.value - self.critical) / -self.rate, TICKS_PRECISION)) + 1
+    
+    def ticks_to_event(self) -> float:
+        return min(self.ticks_to_limit(), self.ticks_to_critical())
+    
     def update(self) -> None:
-        self.value -= 1
+        self.value += self.rate
 
 
 Parameters = Enum(
@@ -291,6 +336,27 @@ class Creature:
             param.update()
         self.save()
     
+    @property
+    def days_to_grow_up(self) -> float:
+        """Количество ИД до перехода в следующий возрастной период."""
+        if self.age >= self.kind.max_age:
+            return inf
+        return self.kind.get_range(self.age)[1] + 1 - self.age
+    
+    def ticks_to_event(
+            self,
+            day_ticks: float = inf,
+            day_tick: int = 0,
+    ) -> float:
+        """Количество пересчётов до ближайшего значимого события: достижения параметром границы диапазона, перехода через критический порог или смены возрастного периода (если известно количество пересчётов в одном ИД и сколько из них уже прошло)."""
+        # между событиями скорость изменения каждого параметра постоянна, поэтому прогноз вычисляется аналитически
+        # inf означает, что без действий игрока состояние питомца больше не изменится
+        ticks = min(
+            (param.ticks_to_event() for param in self.params.values()),
+            default=inf
+        )
+        return min(ticks, self.days_to_grow_up * day_ticks - day_tick)
+    
     @property
     def age(self) -> int:
         return self.__age
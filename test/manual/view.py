@@ -1,13 +1,19 @@
 from itertools import zip_longest, count
+from math import inf
 from pathlib import Path
 from random import choice
-from tkinter import Tk, PhotoImage, StringVar
+from time import monotonic
+from tkinter import Tk, PhotoImage, StringVar, TclError
 from tkinter.ttk import Frame, Button, Label
 
+import assets
 import model
 import controller
 
 
+_asset_pack = assets.AssetPack.open()
+
+
 class RootWidget(Tk):
     """"""
     def __init__(
@@ -21,8 +27,7 @@ class RootWidget(Tk):
 
         screen_width = self.winfo_screenwidth()
         screen_height = self.winfo_screenheight()
-        self.width = screen_width // 3
-        self.height = screen_height * 3 // 4
+        self.width, self.height = assets.window_size(screen_width, screen_height)
         x = screen_width // 2 - self.width // 2
         y = screen_height // 2 - self.height // 2
 
@@ -45,7 +50,6 @@ class RootWidget(Tk):
         except AttributeError:
             pass
         self.mainframe = Game(self)
-        self.mainframe.check_params()
         self.mainframe.update_params()
         self.update()
 
@@ -58,27 +62,17 @@ class MainMenu(Frame):
             kinds: list[model.Kind]
     ):
         super().__init__(master)
-        pad = master.width // 100 + 1
+        pad = assets.menu_padding(master.width)
         self.grid(
             row=0, column=0,
             padx=pad, pady=pad,
             sticky='nsew',
         )
-        columns = 2
-        img_size = (master.width - pad*2*(columns+1)) // columns - 10
+        columns = assets.MENU_COLUMNS
+        img_size = assets.menu_image_size(master.width)
         self._images: list[PhotoImage] = []
         for i, kind in enumerate(kinds):
-            img = PhotoImage(file=kind.image)
-            img_width, img_height = img.width(), img.height()
-            if img_width != img_size or img_height != img_size:
-                img = _resize_image(
-                    img,
-                    img_width,
-                    img_height,
-                    img_size,
-                    img_size,
-                )
-            self._images.append(img)
+            self._images.append(_load_image(kind.image, img_size))
             row, column = divmod(i, columns)
             btn = Button(
                 self,
@@ -108,20 +102,27 @@ class MainMenu(Frame):
 
 class Game(Frame):
     """"""
+    # длительность одного пересчёта параметров питомца в мс реального времени
+    tick: int = 1000
+    
     def __init__(
             self, 
             master: RootWidget, 
     ):
         super().__init__(master)
-        pad = (master.width // 100 + 1) * 2
+        self._last_tick: float = monotonic()
+        self._wakeup: str = None
+        self._redraw: str = None
+        self._phase: tuple[int, int] = None
+        pad = assets.game_padding(master.width)
         ipad = pad // 4
         self.grid(
             row=0, column=0,
             sticky='nsew',
             padx=pad, pady=pad,
         )
-        self._screen_size = master.width - pad * 2
-        self._actions_height = (master.height - self._screen_size - pad*4) // 3
+        self._screen_size = assets.game_screen_size(master.width)
+        self._actions_height = assets.actions_height(master.width, master.height)
         self._text_height = self._actions_height * 2
         self.rowconfigure(0, minsize=self._text_height)
         self.rowconfigure(1, minsize=self._screen_size)
@@ -169,6 +170,7 @@ class Game(Frame):
         )
 
         self._image: PhotoImage = None
+        self._image_path: Path = None
         self.screen = Label(self)
         self.screen.grid(
             row=1, column=0,
@@ -176,34 +178,44 @@ class Game(Frame):
             pady=(0, pad),
         )
 
+        self.buttons_panel: Frame = None
         self.create_buttons()
+        # после сворачивания окна перерисовка параметров возобновляется при его появлении
+        # при разворачивании событие <Map> получает только окно верхнего уровня, а не вложенные виджеты
+        self._map_binding = self.winfo_toplevel().bind('<Map>', self._on_map, add='+')
+
+    def destroy(self):
+        for after_id in (self._wakeup, self._redraw):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self.winfo_toplevel().unbind('<Map>', self._map_binding)
+        super().destroy()
+
+    def _on_map(self, event) -> None:
+        # привязка на окне верхнего уровня срабатывает и при отображении любого вложенного виджета
+        if event.widget is self.winfo_toplevel():
+            self.redraw()
 
     def create_buttons(self):
-        buttons_panel = Frame(self)
+        if self.buttons_panel is not None:
+            self.buttons_panel.destroy()
+        self.buttons_panel = buttons_panel = Frame(self)
+        self._phase = self.master.app.creature.kind.get_range(self.master.app.creature.age)
         buttons_panel.grid(
             row=2, column=0,
             sticky='nsew',
         )
-        buttons = 6
+        buttons = assets.GAME_BUTTONS
         self.actions: list[Button] = []
         self._buttons_images: list[PhotoImage] = []
-        paddings = ((self._screen_size - self._actions_height*6)//(buttons-1),)*(buttons-1) + (0,)
-        img_size = self._actions_height - 10
+        paddings = ((self._screen_size - self._actions_height*buttons)//(buttons-1),)*(buttons-1) + (0,)
+        img_size = assets.action_image_size(self.master.width, self.master.height)
         for action, i in zip_longest(
                 self.master.app.creature.player_actions,
                 range(buttons),
                 fillvalue=model.NoAction()
         ):
-            img = PhotoImage(file=action.image)
-            img_width, img_height = img.width(), img.height()
-            if img_width != img_size or img_height != img_size:
-                img = _resize_image(
-                    img,
-                    img_width,
-                    img_height,
-                    img_size,
-                    img_size,
-                )
+            img = _load_image(action.image, img_size)
             self._buttons_images.append(img)
             btn = Button(
                 buttons_panel,
@@ -212,7 +224,7 @@ class Game(Frame):
                 # необходимо добавить параметр в lambda-функцию, чтобы каждая из создаваемых в цикле функций обращалась к соответствующему экземпляру action
                 # иначе, функции обращаются к action только во время вызова, а не в момент создания
                 # https://docs.python.org/3/faq/programming.html#why-do-lambdas-defined-in-a-loop-with-different-values-all-return-the-same-result
-                command=lambda act=action: self.change_message(f'{act}\n{act.do()}'),
+                command=lambda act=action: self.player_action(act),
             )
             btn.grid(
                 row=0, column=i,
@@ -226,11 +238,16 @@ class Game(Frame):
         self.update_idletasks()
 
     def change_params(self, text: str) -> None:
+        if text == self.params.get():
+            return
         self.params.set(text)
         self.update_idletasks()
 
     def change_image(self, img_path: str | Path) -> None:
-        self._image = PhotoImage(file=img_path)
+        if img_path == self._image_path:
+            return
+        self._image_path = img_path
+        self._image = _load_image(img_path)
         # img_width, img_height = self._image.width(), self._image.height()
         # if img_width != self._screen_size or img_height != self._screen_size:
             # self._image = _resize_image(
@@ -243,18 +260,87 @@ class Game(Frame):
         self.screen.configure(image=self._image)
         self.update_idletasks()
     
+    def player_action(self, action: model.PlayerAction) -> None:
+        # перед действием игрока параметры догоняют реальное время, после действия прогноз событий пересчитывается
+        self.catch_up()
+        self.change_message(f'{action}\n{action.do()}')
+        self.update_params()
+    
     def check_params(self):
         # if self.master.app.creature.params[...]
         self.change_image(controller.DATA_DIR / 'images/dog.png')
-        
-        self.after(250, lambda: self.check_params())
-        self.update()
     
-    def update_params(self):
-        self.master.app.creature.update()
+    def catch_up(self) -> None:
+        """Выполняет пересчёты параметров питомца, накопившиеся с момента последнего пересчёта."""
+        ticks = int((monotonic() - self._last_tick) * 1000 // self.tick)
+        self.master.app.update_creature(ticks)
+        self._last_tick += ticks * self.tick / 1000
+    
+    def _delay(self, ticks: int) -> int:
+        # задержка в мс до момента, когда пройдёт заданное количество пересчётов
+        delay = self._last_tick + ticks * self.tick / 1000 - monotonic()
+        return max(int(delay * 1000), 0)
+    
+    def schedule(self) -> None:
+        """Планирует следующее пробуждение на момент ближайшего прогнозируемого события питомца."""
+        if self._wakeup is not None:
+            self.after_cancel(self._wakeup)
+            self._wakeup = None
+        ticks = self.master.app.creature.ticks_to_event(
+            controller.DAY_TICKS,
+            self.master.app.day_tick,
+        )
+        if ticks != inf:
+            self._wakeup = self.after(self._delay(ticks), self.update_params)
+    
+    def redraw(self) -> None:
+        """Перерисовывает параметры питомца в каждом пересчёте, пока окно видимо и параметры изменяются."""
+        if self._redraw is not None:
+            self.after_cancel(self._redraw)
+            self._redraw = None
+        if not self.winfo_viewable():
+            return
+        self.catch_up()
         self.change_params(repr(self.master.app.creature))
-        self.after(1000, lambda: self.update_params())
-        self.update()
+        # когда параметры перестают изменяться, перерисовка останавливается до следующего события или действия игрока
+        if self.master.app.creature.ticks_to_event() != inf:
+            self._redraw = self.after(self._delay(1), self.redraw)
+    
+    def update_params(self):
+        # пробуждение по событиям, прогнозируемым моделью: смена изображения и действий питомца, перезапуск перерисовки параметров
+        self._wakeup = None
+        self.catch_up()
+        creature = self.master.app.creature
+        if creature.kind.get_range(creature.age) != self._phase:
+            self.create_buttons()
+        self.check_params()
+        self.redraw()
+        self.schedule()
+
+
+def _load_image(
+        img_path: str | Path,
+        size: int = None,
+) -> PhotoImage:
+    # изображения стандартных размеров берутся из пакета без декодирования PNG и масштабирования
+    if _asset_pack is not None:
+        try:
+            img = _asset_pack.image(img_path, size)
+        except TclError:
+            img = None
+        if img is not None:
+            return img
+    img = PhotoImage(file=img_path)
+    img_width, img_height = img.width(), img.height()
+    if size is not None and (img_width != size or img_height != size):
+        img = _resize_image(
+            img,
+            img_width,
+            img_height,
+            size,
+            size,
+        )
+    return img
 
 
 def _resize_image(